@@ -15,12 +15,13 @@ __version__ = "1.0.0"
 
 from .analyze import Analysis, analyze_bytes, analyze_file
 from .builder import AnsiBuilder
-from .render import decode_text, render_bytes, render_file, render_text_raw
+from .render import decode_text, render_bytes, render_bytes_stream, render_file, render_text_raw
 from .sauce import append_minimal_sauce, has_sauce, strip_sauce_tail
 
 __all__ = [
     # Rendering
     "render_bytes",
+    "render_bytes_stream",
     "render_file",
     "render_text_raw",
     "decode_text",
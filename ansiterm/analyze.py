@@ -13,6 +13,18 @@ from pathlib import Path
 
 from .sauce import has_sauce, strip_sauce_tail
 
+# All ANSI markers are single ASCII bytes in CP437, so analysis runs on
+# the raw bytes - no decode pass, half the memory of an intermediate str.
+
+# ANSI escape sequences (CSI), stripped before measuring visible content
+_ESC_SEQ = re.compile(rb"\x1b\[[0-9;?]*[A-Za-z]")
+
+# iCE colors: blink (5) combined with a background color (40-47)
+_ICE_RE = re.compile(rb"\x1b\[[^m]*5[^m]*[4][0-7]m")
+
+# Cursor positioning: ESC[row;colH (or f)
+_CUP_RE = re.compile(rb"\x1b\[\d+;\d+[Hf]")
+
 
 @dataclass
 class Analysis:
@@ -56,50 +68,34 @@ def analyze_bytes(data: bytes) -> Analysis:
     sauce_present = has_sauce(data)
     clean = strip_sauce_tail(data)
 
-    # Decode as CP437
-    try:
-        text = clean.decode("cp437", errors="replace")
-    except Exception:
-        text = str(clean)
-
     # Check for iCE colors (blink + background)
-    uses_ice = bool(re.search(r"\x1b\[[^m]*5[^m]*[4][0-7]m", text))
+    uses_ice = bool(_ICE_RE.search(clean))
 
     # Check for cursor positioning
-    has_cup = bool(re.search(r"\x1b\[\d+;\d+[Hf]", text))
-
-    # Estimate dimensions by analyzing visible content
-    lines = []
-    current_col = 0
-    max_col = 0
-
-    i = 0
-    while i < len(text):
-        if text[i] == "\n":
-            lines.append(max_col)
-            max_col = max(max_col, current_col)
-            current_col = 0
-            i += 1
-        elif text[i] == "\r":
-            current_col = 0
-            i += 1
-        elif text[i] == "\x1b":
-            # Skip escape sequence
-            j = i + 1
-            if j < len(text) and text[j] == "[":
-                j += 1
-                while j < len(text) and text[j] in "0123456789;?":
-                    j += 1
-                if j < len(text):
-                    j += 1  # Final byte
-            i = j
+    has_cup = bool(_CUP_RE.search(clean))
+
+    # Estimate dimensions by measuring visible content. Stripping escapes
+    # with the C regex engine and splitting lines replaces the old
+    # character-at-a-time Python loop. CR resets the column, so only the
+    # part after the last CR on each line is visible.
+    if b"\x1b" in clean:
+        stripped = _ESC_SEQ.sub(b"", clean).replace(b"\x1b", b"")
+        # CUP also resets the column. Positioned art often has no
+        # newlines at all, so for the width measurement treat each
+        # positioning sequence as a line break - otherwise the whole
+        # file collapses into one huge "line". Rows still come from
+        # real newlines; positioned art addresses rows explicitly.
+        if has_cup:
+            col_src = _ESC_SEQ.sub(b"", _CUP_RE.sub(b"\n", clean)).replace(b"\x1b", b"")
         else:
-            current_col += 1
-            i += 1
-
-    lines.append(max_col)
+            col_src = stripped
+    else:
+        stripped = col_src = clean  # Escape-free input: nothing to strip
+    lines = stripped.split(b"\n")
     est_rows = len(lines)
-    est_cols = max(lines) if lines else 0
+    est_cols = max(
+        (len(line.rsplit(b"\r", 1)[-1]) for line in col_src.split(b"\n")), default=0
+    )
 
     # Suggest dimensions
     # 132 if any line > 100 or est_cols > 100
@@ -11,8 +11,39 @@ Examples:
     >>> data = b.to_bytes(add_sauce=True, title="Banner", author="AI")
 """
 
+import codecs
+
 from .sauce import append_minimal_sauce
 
+# CP437 codec functions resolved once - skips the codecs-registry lookup
+# that bytes.decode/str.encode perform on every call
+_CP437_DECODE = codecs.getdecoder("cp437")
+_CP437_ENCODE = codecs.getencoder("cp437")
+
+# Precomputed SGR/control sequences for the common codes - there are only
+# 16 foreground + 16 background colors and a handful of attributes, so
+# formatting them per call is wasted work on color-heavy builders. Stored
+# pre-encoded: all escapes are pure ASCII, so the buffer can accumulate
+# CP437 bytes directly.
+_FG = tuple(f"\x1b[{30 + n}m".encode("ascii") for n in range(8)) + tuple(
+    f"\x1b[{90 + n}m".encode("ascii") for n in range(8)
+)
+_BG = tuple(f"\x1b[{40 + n}m".encode("ascii") for n in range(8)) + tuple(
+    f"\x1b[{100 + n}m".encode("ascii") for n in range(8)
+)
+_RESET = b"\x1b[0m"
+_BOLD = b"\x1b[1m"
+_DIM = b"\x1b[2m"
+_CLEAR = b"\x1b[2J"
+_HOME = b"\x1b[H"
+
+# Box border character sets: (top-left, top-right, bottom-left, bottom-right,
+# horizontal, vertical)
+_BORDERS = {
+    "double": ("╔", "╗", "╚", "╝", "═", "║"),
+    "single": ("┌", "┐", "└", "┘", "─", "│"),
+}
+
 
 class AnsiBuilder:
     """Builder for programmatic ANSI art generation.
@@ -23,7 +54,6 @@ class AnsiBuilder:
     Attributes:
         width: Target width in columns
         height: Target height in rows
-        buf: Internal buffer of text and escape sequences
     """
 
     def __init__(self, width: int = 80, height: int = 25):
@@ -35,7 +65,10 @@ class AnsiBuilder:
         """
         self.width = width
         self.height = height
-        self.buf: list[str] = []
+        # The buffer holds CP437 bytes throughout: escapes are ASCII and
+        # text is encoded as it is appended, so to_bytes() needs no final
+        # encode pass and no intermediate str is ever materialized
+        self._buf = bytearray()
 
     # === Control Sequences ===
 
@@ -48,7 +81,7 @@ class AnsiBuilder:
         Returns:
             Self for chaining
         """
-        self.buf.append(f"\x1b[{';'.join(map(str, params))}m")
+        self._buf += f"\x1b[{';'.join(map(str, params))}m".encode("ascii")
         return self
 
     def move(self, row: int, col: int) -> "AnsiBuilder":
@@ -61,7 +94,7 @@ class AnsiBuilder:
         Returns:
             Self for chaining
         """
-        self.buf.append(f"\x1b[{row};{col}H")
+        self._buf += f"\x1b[{row};{col}H".encode("ascii")
         return self
 
     def clear(self) -> "AnsiBuilder":
@@ -70,7 +103,7 @@ class AnsiBuilder:
         Returns:
             Self for chaining
         """
-        self.buf.append("\x1b[2J")
+        self._buf += _CLEAR
         return self
 
     def home(self) -> "AnsiBuilder":
@@ -79,7 +112,7 @@ class AnsiBuilder:
         Returns:
             Self for chaining
         """
-        self.buf.append("\x1b[H")
+        self._buf += _HOME
         return self
 
     # === Helper Methods ===
@@ -98,8 +131,7 @@ class AnsiBuilder:
             >>> b.fg(1)       # Red
             >>> b.fg(1, True) # Bright red
         """
-        code = 30 + n if not bright else 90 + n
-        self.sgr(code)
+        self._buf += _FG[n + (8 if bright else 0)]
         return self
 
     def bg(self, n: int, bright: bool = False) -> "AnsiBuilder":
@@ -116,8 +148,7 @@ class AnsiBuilder:
             >>> b.bg(4)       # Blue background
             >>> b.bg(4, True) # Bright blue background
         """
-        code = 40 + n if not bright else 100 + n
-        self.sgr(code)
+        self._buf += _BG[n + (8 if bright else 0)]
         return self
 
     def reset(self) -> "AnsiBuilder":
@@ -126,7 +157,7 @@ class AnsiBuilder:
         Returns:
             Self for chaining
         """
-        self.sgr(0)
+        self._buf += _RESET
         return self
 
     def bold(self) -> "AnsiBuilder":
@@ -135,7 +166,7 @@ class AnsiBuilder:
         Returns:
             Self for chaining
         """
-        self.sgr(1)
+        self._buf += _BOLD
         return self
 
     def dim(self) -> "AnsiBuilder":
@@ -144,7 +175,7 @@ class AnsiBuilder:
         Returns:
             Self for chaining
         """
-        self.sgr(2)
+        self._buf += _DIM
         return self
 
     # === Content ===
@@ -152,13 +183,16 @@ class AnsiBuilder:
     def text(self, s: str) -> "AnsiBuilder":
         """Append text (Unicode).
 
+        Characters without a CP437 mapping are replaced ('?') at append
+        time, since the buffer stores CP437 bytes.
+
         Args:
             s: Text to append
 
         Returns:
             Self for chaining
         """
-        self.buf.append(s)
+        self._buf += _CP437_ENCODE(s, "replace")[0]
         return self
 
     def cp437(self, b: bytes) -> "AnsiBuilder":
@@ -170,7 +204,7 @@ class AnsiBuilder:
         Returns:
             Self for chaining
         """
-        self.buf.append(b.decode("cp437", errors="replace"))
+        self._buf += b  # Already CP437 - append as-is
         return self
 
     def newline(self) -> "AnsiBuilder":
@@ -179,7 +213,35 @@ class AnsiBuilder:
         Returns:
             Self for chaining
         """
-        self.buf.append("\n")
+        self._buf += b"\n"
+        return self
+
+    def box(self, row: int, col: int, w: int, h: int, border: str = "double") -> "AnsiBuilder":
+        """Draw a box outline with empty interior.
+
+        Emits the whole box as one precomputed string instead of a
+        move/text call pair per line, so cost scales with characters
+        rather than box height.
+
+        Args:
+            row: Top row (1-based)
+            col: Left column (1-based)
+            w: Box width in columns (including borders)
+            h: Box height in rows (including borders)
+            border: Border style ("double" or "single")
+
+        Returns:
+            Self for chaining
+
+        Examples:
+            >>> b.box(10, 20, 30, 5)  # 30x5 double-line box at (10, 20)
+        """
+        tl, tr, bl, br, hz, vt = _BORDERS[border]
+        parts = [f"\x1b[{row};{col}H{tl}{hz * (w - 2)}{tr}"]
+        for r in range(row + 1, row + h - 1):
+            parts.append(f"\x1b[{r};{col}H{vt}{' ' * (w - 2)}{vt}")
+        parts.append(f"\x1b[{row + h - 1};{col}H{bl}{hz * (w - 2)}{br}")
+        self._buf += _CP437_ENCODE("".join(parts), "replace")[0]
         return self
 
     # === Export ===
@@ -190,7 +252,7 @@ class AnsiBuilder:
         Returns:
             Complete ANSI art as Unicode string
         """
-        return "".join(self.buf)
+        return _CP437_DECODE(bytes(self._buf), "replace")[0]
 
     def to_bytes(
         self,
@@ -214,8 +276,10 @@ class AnsiBuilder:
             >>> b.text("Hello")
             >>> data = b.to_bytes(add_sauce=True, title="Hello", author="AI")
         """
-        text = self.to_text()
-        data = text.encode(codec, errors="replace")
+        if codec == "cp437":
+            data = bytes(self._buf)  # Buffer is already CP437
+        else:
+            data = self.to_text().encode(codec, errors="replace")
 
         if add_sauce:
             # Add width/height if not provided
@@ -9,7 +9,14 @@ import argparse
 import sys
 from pathlib import Path
 
-from .analyze import analyze_file
+try:
+    import termios
+    import tty
+except ImportError:  # Not available on Windows
+    termios = None
+    tty = None
+
+from .analyze import analyze_bytes
 from .builder import AnsiBuilder
 from .render import render_file
 
@@ -61,7 +68,8 @@ Examples:
     args = parser.parse_args()
 
     # Process each file
-    for file_path in args.files:
+    for idx, file_path in enumerate(args.files):
+        is_last = idx == len(args.files) - 1
         path = Path(file_path)
 
         if not path.exists():
@@ -74,8 +82,10 @@ Examples:
 
         try:
             if args.info:
-                # Show analysis
-                analysis = analyze_file(path)
+                # Show analysis (read once so a combined analyze+render
+                # path can reuse the same buffer)
+                data = path.read_bytes()
+                analysis = analyze_bytes(data)
                 print(f"\nFile: {path}")
                 print(f"  SAUCE: {'Yes' if analysis.has_sauce else 'No'}")
                 print(f"  iCE colors: {'Yes' if analysis.uses_ice else 'No'}")
@@ -91,10 +101,12 @@ Examples:
                 # For alt screen mode, we need custom handling to keep art visible
                 if use_alt:
                     # Manual alt screen control to wait before exit
-                    from ansiterm import decode_text
-                    from ansiterm.parser import filter_safe, ice_fix
-                    from ansiterm.render import _enter_alt_screen, _exit_alt_screen, render_text_raw
-                    from ansiterm.sauce import strip_sauce_tail
+                    from ansiterm.render import (
+                        _enter_alt_screen,
+                        _exit_alt_screen,
+                        _prepare,
+                        render_text_raw,
+                    )
 
                     data = path.read_bytes()
 
@@ -103,21 +115,14 @@ Examples:
                         _enter_alt_screen(sys.stdout.write)
                         sys.stdout.flush()
 
-                        # Prepare text (do all processing manually)
-                        clean = strip_sauce_tail(data)
-                        text = decode_text(clean, "cp437")
-
-                        if ice_mode in ("auto", "on"):
-                            text = ice_fix(text)
-
-                        if safe:
-                            text = filter_safe(text)
+                        # Prepare text (SAUCE strip + decode + iCE + filtering)
+                        text = _prepare(data, ice_mode=ice_mode, safe_mode=safe)
 
                         # Render with NO additional terminal control
                         render_text_raw(text)
 
                         # ALWAYS wait before exiting alt screen (so art stays visible!)
-                        if len(args.files) > 1:
+                        if not is_last:
                             sys.stdout.write("\n\nPress Enter for next file (Ctrl+C to quit)...")
                         else:
                             sys.stdout.write("\n\nPress Enter to exit...")
@@ -125,31 +130,32 @@ Examples:
                         sys.stdout.flush()
 
                         # Use raw terminal input (works better in alt screen)
-                        import termios
-                        import tty
-
-                        try:
-                            fd = sys.stdin.fileno()
-                            old_settings = termios.tcgetattr(fd)
+                        if termios is not None:
                             try:
-                                tty.setraw(fd)
-                                # Read single char (Enter = \r or \n)
-                                while True:
-                                    ch = sys.stdin.read(1)
-                                    if ch in ("\r", "\n", "\x03"):  # Enter or Ctrl+C
-                                        if ch == "\x03":
-                                            raise KeyboardInterrupt
-                                        break
-                            finally:
-                                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-                        except (termios.error, AttributeError):
-                            # Fallback to regular input if termios not available
+                                fd = sys.stdin.fileno()
+                                old_settings = termios.tcgetattr(fd)
+                                try:
+                                    tty.setraw(fd)
+                                    # Read single char (Enter = \r or \n)
+                                    while True:
+                                        ch = sys.stdin.read(1)
+                                        if ch in ("\r", "\n", "\x03"):  # Enter or Ctrl+C
+                                            if ch == "\x03":
+                                                raise KeyboardInterrupt
+                                            break
+                                finally:
+                                    termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+                            except (termios.error, AttributeError):
+                                # Fallback to regular input on odd stdins
+                                input()
+                        else:
+                            # No termios (e.g. Windows) - regular input
                             input()
                     finally:
                         _exit_alt_screen(sys.stdout.write)
                         sys.stdout.flush()
 
-                    if args.files.index(file_path) < len(args.files) - 1:
+                    if not is_last:
                         # Not last file, continue to next
                         continue
                     else:
@@ -166,7 +172,7 @@ Examples:
                         clear_first=False,
                     )
 
-                    if len(args.files) > 1:
+                    if not is_last:
                         print("\nPress Enter for next file (Ctrl+C to quit)...")
                         try:
                             input()
@@ -306,21 +312,9 @@ Examples:
 
     start_row = (args.height - box_height) // 2
 
-    # Draw box
-    b.move(start_row, start_col)
-    b.text("╔" + "═" * (box_width - 2) + "╗")
-
-    b.move(start_row + 1, start_col)
-    b.text("║" + " " * (box_width - 2) + "║")
-
-    b.move(start_row + 2, start_col)
-    b.text("║ " + args.text + " ║")
-
-    b.move(start_row + 3, start_col)
-    b.text("║" + " " * (box_width - 2) + "║")
-
-    b.move(start_row + 4, start_col)
-    b.text("╚" + "═" * (box_width - 2) + "╝")
+    # Draw box, then the label over its middle row
+    b.box(start_row, start_col, box_width, box_height)
+    b.move(start_row + 2, start_col + 2).text(args.text)
 
     b.reset()
 
@@ -11,6 +11,30 @@ We don't need a full DEC VT parser - just enough for BBS art.
 import re
 from typing import Iterator
 
+# CSI parameter bytes - matching from the current position moves the
+# per-character advance loop into the C regex engine
+_CSI_PARAMS = re.compile(r"[0-9;?]*")
+
+# Probe for anything the safety filter might have to drop: an ESC that
+# does not start a complete CSI sequence with a known-safe final byte
+# (or a DEC private ?-sequence). If this never matches, filtering would
+# keep every token, so the input can be returned unchanged. Typical art
+# files contain only SGR/CUP sequences and pass the probe in one C scan.
+_UNSAFE_PROBE = re.compile(r"\x1b(?!\[[0-9;]*[mHfABCDJKsu]|\[\?[0-9;?]*[hl])")
+
+# CSI final-byte dispatch table: one indexed load instead of a chain of
+# string comparisons per sequence. None means unknown (drop/other).
+_CSI_KIND: list[str | None] = [None] * 256
+_CSI_KIND[ord("m")] = "sgr"
+_CSI_KIND[ord("H")] = _CSI_KIND[ord("f")] = "cup"
+for _c in "ABCD":
+    _CSI_KIND[ord(_c)] = "cursor_move"
+_CSI_KIND[ord("J")] = "ed"
+_CSI_KIND[ord("K")] = "el"
+_CSI_KIND[ord("s")] = _CSI_KIND[ord("u")] = "cursor_save"
+_CSI_KIND[ord("h")] = _CSI_KIND[ord("l")] = "dec"  # DEC private; requires '?' in seq
+del _c
+
 
 def ice_fix(text: str) -> str:
     """Map iCE colors: blink (SGR 5) + background (40-47) -> bright background (100-107).
@@ -32,33 +56,79 @@ def ice_fix(text: str) -> str:
         >>> ice_fix("\\x1b[5;44mTEXT\\x1b[0m")
         '\\x1b[104mTEXT\\x1b[0m'  # Blink dropped, bg 44 -> 104
     """
-    _sgr = re.compile(r"\x1b\[([0-9;]*)m")
+    if "\x1b[" not in text or "5" not in text:
+        # An iCE sequence needs both a CSI intro and a blink param; most
+        # modern art has no blink at all, so one substring probe skips
+        # the whole scan
+        return text
+
+    out = []
+    i = 0
+    n = len(text)
 
-    def repl(match):
-        raw = match.group(1)
-        if not raw:
-            return match.group(0)
+    while i < n:
+        # Jump to the next candidate SGR sequence (C-level scan)
+        j = text.find("\x1b[", i)
+        if j == -1:
+            out.append(text[i:])
+            break
+        if j > i:
+            out.append(text[i:j])
+
+        # Scan parameter bytes, accumulating ints directly (no split/int round-trip)
+        k = j + 2
+        params = []
+        cur = -1  # -1 means "no digits seen for current param"
+        while k < n:
+            c = text[k]
+            if "0" <= c <= "9":
+                cur = (cur * 10 if cur >= 0 else 0) + (ord(c) - 48)
+            elif c == ";":
+                if cur >= 0:
+                    params.append(cur)
+                    cur = -1
+            else:
+                break
+            k += 1
+        if cur >= 0:
+            params.append(cur)
+
+        if k >= n:
+            # Unterminated sequence at end of input - copy verbatim
+            out.append(text[j:])
+            break
 
-        try:
-            params = [int(p) for p in raw.split(";") if p]
-        except ValueError:
-            return match.group(0)
+        if text[k] != "m":
+            # Not an SGR sequence (or contains non-numeric params) - copy what
+            # we scanned and resync at the final byte
+            out.append(text[j:k])
+            i = k
+            continue
 
-        # Check if blink (5) present
         if 5 not in params:
-            return match.group(0)
+            out.append(text[j : k + 1])
+            i = k + 1
+            continue
+
+        out.append(_map_ice_params(params))
+        i = k + 1
 
-        # Map blink + background (40-47) to bright background (100-107)
-        out = []
-        for p in params:
-            if 40 <= p <= 47:
-                out.append(p + 60)  # 40->100, 41->101, ..., 47->107
-            elif p != 5:  # Drop blink
-                out.append(p)
+    return "".join(out)
 
-        return f"\x1b[{';'.join(map(str, out))}m"
 
-    return _sgr.sub(repl, text)
+def _map_ice_params(params: list[int]) -> str:
+    """Rebuild an SGR sequence from params containing blink (5).
+
+    Maps background colors (40-47) to bright (100-107) and drops the blink.
+    """
+    mapped = []
+    for p in params:
+        if 40 <= p <= 47:
+            mapped.append(p + 60)  # 40->100, 41->101, ..., 47->107
+        elif p != 5:  # Drop blink
+            mapped.append(p)
+
+    return f"\x1b[{';'.join(map(str, mapped))}m"
 
 
 def tokenize_ansi(text: str, safe_mode: bool = True) -> Iterator[tuple[str, str]]:
@@ -91,30 +161,21 @@ def tokenize_ansi(text: str, safe_mode: bool = True) -> Iterator[tuple[str, str]
         if text[i] == "\x1b" and i + 1 < len(text):
             # CSI sequence: ESC [
             if text[i + 1] == "[":
-                # Find final byte
-                j = i + 2
-                while j < len(text) and text[j] in "0123456789;?":
-                    j += 1
+                # Skip parameter bytes, then the final byte
+                j = _CSI_PARAMS.match(text, i + 2).end()
 
                 if j < len(text):
                     final = text[j]
                     seq = text[i : j + 1]
 
-                    # Classify by final byte
-                    if final == "m":
-                        yield ("sgr", seq)
-                    elif final in "Hf":
-                        yield ("cup", seq)
-                    elif final in "ABCD":  # Cursor movement (Up, Down, Right, Left)
-                        yield ("cursor_move", seq)
-                    elif final == "J":
-                        yield ("ed", seq)
-                    elif final == "K":
-                        yield ("el", seq)
-                    elif final in "hl" and "?" in seq:
-                        yield ("dec", seq)
-                    elif final in "su":  # Save/restore cursor
-                        yield ("cursor_save", seq)
+                    # Classify by final byte (ord may exceed 255 for decoded CP437)
+                    o = ord(final)
+                    kind = _CSI_KIND[o] if o < 256 else None
+                    if kind == "dec" and "?" not in seq:
+                        kind = None
+
+                    if kind is not None:
+                        yield (kind, seq)
                     elif safe_mode:
                         yield ("drop", seq)  # Unknown in safe mode
                     else:
@@ -144,14 +205,14 @@ def tokenize_ansi(text: str, safe_mode: bool = True) -> Iterator[tuple[str, str]
                     break
                 continue
 
-        # Regular text
-        next_esc = text.find("\x1b", i)
+        # Regular text (search from i+1 so a stray/unterminated ESC at i is
+        # consumed as text rather than looping forever)
+        next_esc = text.find("\x1b", i + 1)
         if next_esc == -1:
             yield ("text", text[i:])
             break
         else:
-            if next_esc > i:
-                yield ("text", text[i:next_esc])
+            yield ("text", text[i:next_esc])
             i = next_esc
 
 
@@ -181,8 +242,122 @@ def filter_safe(text: str) -> str:
         >>> filter_safe("\\x1b[31mRed\\x1b]0;Title\\x07")
         '\\x1b[31mRed'  # OSC dropped
     """
-    result = []
-    for token_type, content in tokenize_ansi(text, safe_mode=True):
-        if token_type != "drop":
-            result.append(content)
-    return "".join(result)
+    if "\x1b" not in text:
+        return text  # No escapes - nothing to filter
+
+    # Delegate to the direct single-pass loop rather than iterating
+    # tokenize_ansi - same classification, but no generator frame or
+    # per-token tuple allocation. tokenize_ansi remains the public API
+    # for callers that want the token stream.
+    return transform(text, ice=False, safe=True)
+
+
+def transform(text: str, ice: bool = True, safe: bool = True) -> str:
+    """Apply iCE color mapping and safety filtering in a single pass.
+
+    Equivalent to ice_fix() followed by filter_safe(), but walks the text
+    once instead of making two full passes (and two intermediate string
+    copies). This is the function the display path should use.
+
+    Args:
+        text: Text with ANSI escape sequences
+        ice: Map iCE colors (blink + bg -> bright bg)
+        safe: Drop dangerous sequences (OSC, unknown CSI)
+
+    Returns:
+        Transformed text
+
+    Examples:
+        >>> transform("\\x1b[5;44mTEXT\\x1b]0;Title\\x07")
+        '\\x1b[104mTEXT'  # iCE mapped, OSC dropped
+    """
+    if "\x1b" not in text:
+        return text  # No escapes - nothing to rewrite or filter
+
+    if ice and "5" not in text:
+        ice = False  # No blink param anywhere - skip the SGR rewrites
+
+    if not ice and safe and _UNSAFE_PROBE.search(text) is None:
+        # Nothing to rewrite and nothing the filter would drop - the
+        # common case for trusted/builder-generated output
+        return text
+
+    out = []
+    i = 0
+    n = len(text)
+
+    while i < n:
+        if text[i] == "\x1b" and i + 1 < n:
+            # CSI sequence: ESC [
+            if text[i + 1] == "[":
+                j = _CSI_PARAMS.match(text, i + 2).end()
+
+                if j >= n:
+                    # Unterminated CSI at end of input
+                    if not safe:
+                        out.append(text[i:])
+                    break
+
+                final = text[j]
+                seq = text[i : j + 1]
+
+                o = ord(final)
+                kind = _CSI_KIND[o] if o < 256 else None
+                if kind == "dec" and "?" not in seq:
+                    kind = None
+
+                if kind == "sgr":
+                    out.append(_ice_sgr(seq) if ice else seq)
+                elif kind is not None or not safe:
+                    out.append(seq)
+
+                i = j + 1
+                continue
+
+            # OSC sequence: ESC ]
+            elif text[i + 1] == "]" and safe:
+                j = i + 2
+                while j < n:
+                    if text[j] == "\x07":  # BEL
+                        i = j + 1
+                        break
+                    elif text[j : j + 2] == "\x1b\\":  # ESC backslash
+                        i = j + 2
+                        break
+                    j += 1
+                else:
+                    # No terminator found, drop rest
+                    break
+                continue
+
+        # Regular text
+        next_esc = text.find("\x1b", i + 1)
+        if next_esc == -1:
+            out.append(text[i:])
+            break
+        out.append(text[i:next_esc])
+        i = next_esc
+
+    return "".join(out)
+
+
+def _ice_sgr(seq: str) -> str:
+    """Rewrite a single SGR sequence for iCE colors (see ice_fix)."""
+    params = []
+    cur = -1
+    for c in seq[2:-1]:
+        if "0" <= c <= "9":
+            cur = (cur * 10 if cur >= 0 else 0) + (ord(c) - 48)
+        elif c == ";":
+            if cur >= 0:
+                params.append(cur)
+                cur = -1
+        else:
+            return seq  # Non-numeric param (shouldn't happen for SGR)
+    if cur >= 0:
+        params.append(cur)
+
+    if 5 not in params:
+        return seq
+
+    return _map_ice_params(params)
@@ -8,13 +8,31 @@ This module handles:
 - Windows compatibility (colorama)
 """
 
+import codecs
 import os
 import sys
 from pathlib import Path
+from typing import Iterable
 
-from .parser import filter_safe, ice_fix
+from .parser import transform
 from .sauce import strip_sauce_tail
 
+# CP437 decoder resolved once - skips the codecs-registry lookup that
+# bytes.decode performs on every call. (A latin-1 decode + str.translate
+# table was measured ~10x slower than the charmap codec, so that variant
+# was rejected.)
+_CP437_DECODE = codecs.getdecoder("cp437")
+
+# Windows compatibility: fix the console once at import time instead of
+# re-running the import machinery on every render call
+if os.name == "nt":
+    try:
+        import colorama
+
+        colorama.just_fix_windows_console()
+    except Exception:
+        pass  # Colorama optional on Windows
+
 
 def decode_text(data: bytes, codec: str = "cp437") -> str:
     """Decode bytes to text using specified codec.
@@ -30,19 +48,88 @@ def decode_text(data: bytes, codec: str = "cp437") -> str:
         >>> decode_text(b"\\xc9\\xcd\\xbb")  # Box drawing chars
         '╔═╗'
     """
+    if codec == "cp437":
+        if data.isascii():
+            # ASCII bytes are identical in CP437 - isascii() is a single
+            # C pass and the ascii decode skips the charmap walk entirely
+            return data.decode("ascii")
+        return _CP437_DECODE(data, "replace")[0]
     return data.decode(codec, errors="replace")
 
 
+# Alt screen + disable wrap + hide cursor + clear + home
+_ALT_ENTER = "\x1b[?1049h\x1b[?7l\x1b[?25l\x1b[2J\x1b[H"
+
+# Reset colors + show cursor + enable wrap + leave alt screen
+_ALT_EXIT = "\x1b[0m\x1b[?25h\x1b[?7h\x1b[?1049l"
+
+
+def _prepare(data: bytes, codec: str = "cp437", ice_mode: str = "auto", safe_mode: bool = True) -> str:
+    """Prepare raw art bytes for display.
+
+    Strips SAUCE, decodes, and applies iCE mapping plus safety filtering
+    in one parser pass - the old ice_fix-then-filter_safe sequence walked
+    the text twice and materialized an extra full-size copy.
+
+    Args:
+        data: Raw ANSI art bytes (possibly with SAUCE)
+        codec: Character encoding (default: cp437)
+        ice_mode: iCE color handling ("auto" | "on" | "off")
+        safe_mode: Filter dangerous escape sequences
+
+    Returns:
+        Display-ready text
+    """
+    text = decode_text(strip_sauce_tail(data), codec)
+    return transform(text, ice=ice_mode in ("auto", "on"), safe=safe_mode)
+
+
+def _write_text(s: str) -> None:
+    """Write pre-assembled output, bypassing the text layer.
+
+    The escapes and art are already one big string, so encode to UTF-8
+    once and push bytes below TextIOWrapper: straight to the fd with
+    os.write on a real terminal, or through sys.stdout.buffer when
+    redirected - either way skipping the text layer's per-call codec
+    machinery. Only stdouts with no binary layer at all (StringIO, some
+    IDE consoles) take the plain sys.stdout.write path.
+    """
+    try:
+        fd = sys.stdout.fileno()
+        is_tty = os.isatty(fd)
+    except (OSError, ValueError, AttributeError):
+        fd = None
+        is_tty = False
+
+    buffer = getattr(sys.stdout, "buffer", None)
+    if not is_tty and buffer is None:
+        # No binary layer to write through - stay in the text layer
+        sys.stdout.write(s)
+        sys.stdout.flush()
+        return
+
+    # Flush any buffered text first so ordering is preserved
+    sys.stdout.flush()
+    payload = s.encode("utf-8", errors="replace")
+
+    if is_tty:
+        mv = memoryview(payload)
+        n = 0
+        while n < len(mv):
+            n += os.write(fd, mv[n:])
+    else:
+        buffer.write(payload)
+        buffer.flush()
+
+
 def _enter_alt_screen(out):
     """Enter alternate screen with proper terminal setup."""
-    # Alt screen + disable wrap + hide cursor + clear + home
-    out("\x1b[?1049h\x1b[?7l\x1b[?25l\x1b[2J\x1b[H")
+    out(_ALT_ENTER)
 
 
 def _exit_alt_screen(out):
     """Exit alternate screen and restore terminal state."""
-    # Reset colors + show cursor + enable wrap + leave alt screen
-    out("\x1b[0m\x1b[?25h\x1b[?7h\x1b[?1049l")
+    out(_ALT_EXIT)
 
 
 def render_bytes(
@@ -78,59 +165,66 @@ def render_bytes(
         >>> data = Path("banner.ans").read_bytes()
         >>> render_bytes(data)  # Renders to terminal with full state management
     """
-    # Windows compatibility
-    if os.name == "nt":
-        try:
-            import colorama
+    # Prepare text (single fused pass)
+    text = _prepare(data, codec, ice_mode, safe_mode)
+
+    # Build the setup/teardown sequences up front so setup + art go out in
+    # one write (and restore in one write), instead of a write per flag
+    if use_alt_screen:
+        prelude = _ALT_ENTER
+        postlude = _ALT_EXIT
+    else:
+        prelude = ""
+        if disable_wrap:
+            prelude += "\x1b[?7l"
+        if hide_cursor:
+            prelude += "\x1b[?25l"
+        if clear_first:
+            prelude += "\x1b[2J\x1b[H"
+        postlude = "\x1b[0m"  # Reset colors
+        if hide_cursor:
+            postlude += "\x1b[?25h"  # Show cursor
+        if disable_wrap:
+            postlude += "\x1b[?7h"  # Enable wrap
 
-            colorama.just_fix_windows_console()
-        except Exception:
-            pass  # Colorama optional on Windows
+    try:
+        _write_text(prelude + text)
+    finally:
+        # Always restore terminal state
+        _write_text(postlude)
 
-    # Prepare text
-    raw = strip_sauce_tail(data)
-    text = decode_text(raw, codec)
 
-    # Apply iCE color mapping
-    if ice_mode in ("auto", "on"):
-        text = ice_fix(text)
+def render_bytes_stream(
+    frames: Iterable[bytes],
+    *,
+    codec: str = "cp437",
+    ice_mode: str = "auto",
+    safe_mode: bool = True,
+) -> None:
+    """Render a sequence of ANSI art frames in one alt-screen session.
 
-    # Apply safety filtering
-    if safe_mode:
-        text = filter_safe(text)
+    Enters the alternate screen once, homes the cursor and draws each
+    frame, then restores the terminal once at the end - amortizing the
+    setup/teardown writes across all frames instead of paying them per
+    render_bytes() call. Useful for slideshows and simple animations.
 
-    # Output function
-    out = sys.stdout.write
+    Args:
+        frames: Iterable of raw ANSI art byte buffers (possibly with SAUCE)
+        codec: Character encoding (default: cp437)
+        ice_mode: iCE color handling ("auto" | "on" | "off")
+        safe_mode: Filter dangerous escape sequences
 
+    Examples:
+        >>> frames = (Path(p).read_bytes() for p in paths)
+        >>> render_bytes_stream(frames)
+    """
+    _write_text(_ALT_ENTER)
     try:
-        # Enter alt screen with setup
-        if use_alt_screen:
-            _enter_alt_screen(out)
-        else:
-            # Partial setup without alt screen
-            if disable_wrap:
-                out("\x1b[?7l")
-            if hide_cursor:
-                out("\x1b[?25l")
-            if clear_first:
-                out("\x1b[2J\x1b[H")
-
-        # Render the art
-        out(text)
-        sys.stdout.flush()
-
+        for frame in frames:
+            _write_text("\x1b[H" + _prepare(frame, codec, ice_mode, safe_mode))
     finally:
         # Always restore terminal state
-        if use_alt_screen:
-            _exit_alt_screen(out)
-        else:
-            # Partial restore
-            out("\x1b[0m")  # Reset colors
-            if hide_cursor:
-                out("\x1b[?25h")  # Show cursor
-            if disable_wrap:
-                out("\x1b[?7h")  # Enable wrap
-        sys.stdout.flush()
+        _write_text(_ALT_EXIT)
 
 
 def render_text_raw(text: str) -> None:
@@ -10,9 +10,30 @@ This module provides minimal SAUCE v00 support:
 - Creation: append_minimal_sauce()
 """
 
+import struct
 from datetime import datetime
 from typing import Optional
 
+# SAUCE v00 record layout (128 bytes, little-endian):
+# ID(5) Version(2) Title(35) Author(20) Group(20) Date(8) FileSize(4)
+# DataType(1) FileType(1) TInfo1-4(2 each) Comments(1) TFlags(1) TInfoS(22)
+_SAUCE_STRUCT = struct.Struct("<5s2s35s20s20s8sIBBHHHHBB22s")
+
+
+def _field(s: str, width: int) -> bytes:
+    """Encode a SAUCE string field to exactly `width` space-padded bytes.
+
+    ASCII titles (the common case) take the fast ascii codec; anything
+    else goes through cp437 with replacement. Truncation happens after
+    encoding (cp437 is single-byte, so the result is the same as
+    slicing the str first) and padding allocates once instead of
+    slice-then-ljust.
+    """
+    enc = s.encode("ascii") if s.isascii() else s.encode("cp437", errors="replace")
+    if len(enc) >= width:
+        return enc[:width]
+    return enc + b" " * (width - len(enc))
+
 
 def has_sauce(data: bytes) -> bool:
     """Check if data contains a SAUCE block.
@@ -27,7 +48,8 @@ def has_sauce(data: bytes) -> bool:
     """
     if len(data) < 128:
         return False
-    return data[-128:-123] == b"SAUCE"
+    # startswith with an offset checks in place - no tail-slice copy
+    return data.startswith(b"SAUCE", len(data) - 128)
 
 
 def strip_sauce_tail(data: bytes) -> bytes:
@@ -47,12 +69,14 @@ def strip_sauce_tail(data: bytes) -> bytes:
         >>> clean
         b'ANSI art content'
     """
-    if len(data) >= 128 and data[-128:-123] == b"SAUCE":
+    if len(data) >= 128 and data.startswith(b"SAUCE", len(data) - 128):
         return data[:-128]
 
-    # Defensive: Some files have padding before SAUCE
-    last = data.rfind(b"SAUCE")
-    if last != -1 and len(data) - last <= 512:
+    # Defensive: Some files have padding before SAUCE. Only a marker within
+    # the last 512 bytes counts, so bound the search instead of scanning
+    # the whole buffer on multi-MB inputs.
+    last = data.rfind(b"SAUCE", max(0, len(data) - 512))
+    if last != -1:
         return data[:last]
 
     return data
@@ -104,49 +128,25 @@ def append_minimal_sauce(
     if yyyymmdd is None:
         yyyymmdd = datetime.now().strftime("%Y%m%d")
 
-    # Build SAUCE block (128 bytes total)
-    sauce = bytearray(128)
-
-    # ID (5 bytes): "SAUCE"
-    sauce[0:5] = b"SAUCE"
-
-    # Version (2 bytes): "00"
-    sauce[5:7] = b"00"
-
-    # Title (35 bytes, padded with spaces)
-    sauce[7:42] = title[:35].encode("cp437", errors="replace").ljust(35, b" ")
-
-    # Author (20 bytes)
-    sauce[42:62] = author[:20].encode("cp437", errors="replace").ljust(20, b" ")
-
-    # Group (20 bytes)
-    sauce[62:82] = group[:20].encode("cp437", errors="replace").ljust(20, b" ")
-
-    # Date (8 bytes): YYYYMMDD
-    sauce[82:90] = yyyymmdd[:8].encode("ascii", errors="replace").ljust(8, b" ")
-
-    # FileSize (4 bytes, little-endian) - original file size before SAUCE
-    file_size = len(data)
-    sauce[90:94] = file_size.to_bytes(4, byteorder="little")
-
-    # DataType (1 byte)
-    sauce[94] = datatype
-
-    # FileType (1 byte)
-    sauce[95] = filetype
-
-    # TInfo1 (2 bytes, little-endian) - width hint
-    if tinfo1 is not None:
-        sauce[96:98] = tinfo1.to_bytes(2, byteorder="little")
-
-    # TInfo2 (2 bytes, little-endian) - height hint
-    if tinfo2 is not None:
-        sauce[98:100] = tinfo2.to_bytes(2, byteorder="little")
-
-    # TInfo3, TInfo4, TFlags (leave as zeros for minimal implementation)
-    # sauce[100:106] already zero-filled
-
-    # TInfoS (22 bytes) - optional filler string, leave empty
-    # sauce[106:128] already zero-filled
-
-    return data + bytes(sauce)
+    # Emit the whole 128-byte block in one pack - the layout is fixed, so
+    # there is no need for a bytearray and a slice store per field
+    sauce = _SAUCE_STRUCT.pack(
+        b"SAUCE",
+        b"00",
+        _field(title, 35),
+        _field(author, 20),
+        _field(group, 20),
+        yyyymmdd[:8].encode("ascii", errors="replace").ljust(8, b" "),
+        len(data),  # FileSize - original size before SAUCE
+        datatype,
+        filetype,
+        tinfo1 or 0,  # TInfo1 - width hint
+        tinfo2 or 0,  # TInfo2 - height hint
+        0,  # TInfo3
+        0,  # TInfo4
+        0,  # Comments (none in minimal implementation)
+        0,  # TFlags
+        b"",  # TInfoS - null-padded by pack
+    )
+
+    return data + sauce
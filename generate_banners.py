@@ -6,386 +6,187 @@ Each banner has its own aesthetic:
 - underground: Street art chaos
 - matrix: Green-on-black code rain
 - retro: Full 90s BBS with gradient borders
+
+The banners are static layouts, so each generator builds a flat list of
+pre-formatted escape+text segments and joins/encodes once, instead of
+going through per-call builder method dispatch. Escape cheat sheet:
+ESC[2J\\ESC[H clear+home, ESC[{r};{c}H move, ESC[3Xm/9Xm fg (dim/bright),
+ESC[4Xm/10Xm bg, ESC[1m bold, ESC[2m dim, ESC[0m reset.
 """
 
+import hashlib
 from pathlib import Path
 
-from ansiterm import AnsiBuilder
+from ansiterm import append_minimal_sauce
 
+_CLEAR_HOME = "\x1b[2J\x1b[H"
+_RESET = "\x1b[0m"
 
-def generate_classic(version: str) -> bytes:
-    """Classic: Clean cyan professional banner."""
-    b = AnsiBuilder(80, 25)
-    b.clear().home()
-
-    # Title
-    b.move(8, 15)
-    b.fg(6, bright=True)  # Bright cyan
-    b.text("▄▀█ █▀▄▀█ █▀█ █░░ █ █▀▀ █ █▀▀ █▀█")
-
-    b.move(9, 15)
-    b.text("█▀█ █░▀░█ █▀▀ █▄▄ █ █▀░ █ ██▄ █▀▄")
-
-    # Separator
-    b.move(11, 10)
-    b.fg(6)  # Cyan
-    b.text("─" * 60)
-
-    # Status line
-    b.move(13, 10)
-    b.fg(7)  # White
-    b.text("● SYSTEM READY     ● AI CORE ACTIVE     ● v" + version)
-
-    # Description
-    b.move(15, 10)
-    b.sgr(2)  # Dim
-    b.text("Interactive AI Development Environment")
-
-    # Commands
-    b.move(17, 10)
-    b.sgr(2)
-    b.text("Commands: /help │ /think │ /do │ Ctrl-J │ Ctrl-D")
-
-    b.reset()
-
-    return b.to_bytes(
-        add_sauce=True,
-        title="Amplifier Classic",
+# Static separator rows shared across calls, built once at import
+_RULE60 = "─" * 60
+_BLOCKS76 = "▓" * 76
+_LIGHT78 = "░" * 78
+_MEDIUM78 = "▒" * 78
+_HEAVY78 = "▓" * 78
+
+
+def _finish(parts: list[str], title: str) -> bytes:
+    """Join segments, encode to CP437 and wrap with SAUCE metadata."""
+    data = "".join(parts).encode("cp437", errors="replace")
+    return append_minimal_sauce(
+        data,
+        title=title,
         author="Amplifier Team",
         group="Microsoft",
+        tinfo1=80,
+        tinfo2=25,
     )
 
 
+def generate_classic(version: str) -> bytes:
+    """Classic: Clean cyan professional banner."""
+    parts = [
+        _CLEAR_HOME,
+        # Title (bright cyan)
+        "\x1b[8;15H\x1b[96m▄▀█ █▀▄▀█ █▀█ █░░ █ █▀▀ █ █▀▀ █▀█",
+        "\x1b[9;15H█▀█ █░▀░█ █▀▀ █▄▄ █ █▀░ █ ██▄ █▀▄",
+        # Separator (cyan)
+        "\x1b[11;10H\x1b[36m" + _RULE60,
+        # Status line (white)
+        f"\x1b[13;10H\x1b[37m● SYSTEM READY     ● AI CORE ACTIVE     ● v{version}",
+        # Description (dim)
+        "\x1b[15;10H\x1b[2mInteractive AI Development Environment",
+        # Commands (dim)
+        "\x1b[17;10H\x1b[2mCommands: /help │ /think │ /do │ Ctrl-J │ Ctrl-D",
+        _RESET,
+    ]
+    return _finish(parts, "Amplifier Classic")
+
+
+# Top gradient row for the cyber banner: 75 cells cycling through
+# yellow, cyan, magenta, green, red - precomputed once
+_CYBER_GRADIENT = "".join(f"\x1b[{90 + c}m▓" for c in ([3, 6, 5, 2, 1] * 15)[:75])
+
+
 def generate_cyber(version: str) -> bytes:
     """Cyber: Rainbow gradient blocks and neon colors."""
-    b = AnsiBuilder(80, 25)
-    b.clear().home()
-
-    # Top rainbow gradient
-    b.move(4, 2)
-    colors = [3, 6, 5, 2, 1] * 15  # Yellow, cyan, magenta, green, red
-    for color in colors[:75]:
-        b.fg(color % 8, bright=True)
-        b.text("▓")
-
-    # Title box
-    b.move(8, 20)
-    b.fg(6, bright=True)  # Bright cyan
-    b.text("╔══════════════════════════════════════╗")
-
-    b.move(9, 20)
-    b.text("║                                      ║")
-
-    b.move(10, 20)
-    b.fg(3, bright=True)  # Bright yellow
-    b.text("║         A M P L I F I E R           ║")
-
-    b.move(11, 20)
-    b.fg(6, bright=True)
-    b.text("║                                      ║")
-
-    b.move(12, 20)
-    b.text("╚══════════════════════════════════════╝")
-
-    # Status indicators
-    b.move(15, 10)
-    b.fg(2, bright=True)  # Bright green
-    b.text("◉")
-    b.fg(7)  # White
-    b.text(" ONLINE  ")
-
-    b.fg(6, bright=True)  # Bright cyan
-    b.text("◉")
-    b.fg(7)
-    b.text(" ACTIVE  ")
-
-    b.fg(5, bright=True)  # Bright magenta
-    b.text("◉")
-    b.fg(7)
-    b.text(" FLOWING  ")
-
-    b.sgr(2)  # Dim
-    b.text(f" v{version}")
-
-    # Commands
-    b.move(18, 10)
-    b.sgr(2)
-    b.text("CMD: /help │ /think │ /do │ Ctrl-J │ Ctrl-D")
-
-    # Ready indicator
-    b.move(20, 35)
-    b.fg(5, bright=True)
-    b.bg(5)  # Magenta on magenta background
-    b.text(" READY ")
-
-    b.reset()
-
-    return b.to_bytes(
-        add_sauce=True,
-        title="Amplifier Cyber",
-        author="Amplifier Team",
-        group="Microsoft",
-    )
+    parts = [
+        _CLEAR_HOME,
+        # Top rainbow gradient
+        "\x1b[4;2H" + _CYBER_GRADIENT,
+        # Title box (bright cyan, title line bright yellow)
+        "\x1b[8;20H\x1b[96m╔══════════════════════════════════════╗",
+        "\x1b[9;20H║                                      ║",
+        "\x1b[10;20H\x1b[93m║         A M P L I F I E R           ║",
+        "\x1b[11;20H\x1b[96m║                                      ║",
+        "\x1b[12;20H╚══════════════════════════════════════╝",
+        # Status indicators
+        "\x1b[15;10H\x1b[92m◉\x1b[37m ONLINE  \x1b[96m◉\x1b[37m ACTIVE  \x1b[95m◉\x1b[37m FLOWING  ",
+        f"\x1b[2m v{version}",
+        # Commands (dim)
+        "\x1b[18;10H\x1b[2mCMD: /help │ /think │ /do │ Ctrl-J │ Ctrl-D",
+        # Ready indicator (bright magenta on magenta)
+        "\x1b[20;35H\x1b[95m\x1b[45m READY ",
+        _RESET,
+    ]
+    return _finish(parts, "Amplifier Cyber")
+
+
+# Chaotic title for the underground banner - each letter a different
+# bright color, precomputed once
+_UNDERGROUND_TITLE = "".join(
+    f"\x1b[{90 + c}m{ch} " for ch, c in zip("AMPLIFIER", [1, 3, 2, 6, 4, 5, 1, 3, 2])
+)
 
 
 def generate_underground(version: str) -> bytes:
     """Underground: Street art chaos with rainbow colors."""
-    b = AnsiBuilder(80, 25)
-    b.clear().home()
-
-    # Chaotic title - each letter different color
-    title_colors = [1, 3, 2, 6, 4, 5, 1, 3, 2]  # Red, yellow, green, cyan, blue, magenta
-    title = "AMPLIFIER"
-
-    b.move(6, 25)
-    for i, char in enumerate(title):
-        b.fg(title_colors[i % len(title_colors)], bright=True)
-        b.text(char + " ")
-
-    # Underground node banner
-    b.move(9, 20)
-    b.sgr(2).fg(1)  # Dim red
-    b.text("UNDERGROUND NODE")
-
-    b.fg(1, bright=True)
-    b.text("  ✗")
-    b.bg(1).fg(7, bright=True)  # White on red
-    b.text(" NO RULES ")
-    b.reset().fg(1, bright=True)
-    b.text("✗")
-
-    b.sgr(2).fg(1)
-    b.text(f"  v{version}")
-
-    # System checklist
-    b.move(12, 18)
-    b.sgr(2).fg(7)
-    b.text("├── ")
-    b.fg(2, bright=True)
-    b.text("✓")
-    b.fg(7)
-    b.text(" SYSTEM ARMED")
-
-    b.move(13, 18)
-    b.sgr(2).fg(7)
-    b.text("├── ")
-    b.fg(2, bright=True)
-    b.text("✓")
-    b.fg(7)
-    b.text(" AI CORE LOADED")
-
-    b.move(14, 18)
-    b.sgr(2).fg(7)
-    b.text("├── ")
-    b.fg(2, bright=True)
-    b.text("✓")
-    b.fg(7)
-    b.text(" SECURITY BYPASSED")
-
-    b.move(15, 18)
-    b.sgr(2).fg(7)
-    b.text("└── ")
-    b.fg(2, bright=True)
-    b.text("✓")
-    b.fg(7)
-    b.text(" ALL SYSTEMS GO")
-
-    # Commands with slashes
-    b.move(18, 18)
-    b.fg(1, bright=True)
-    b.text("/")
-    b.fg(3, bright=True)
-    b.text("/")
-    b.fg(2, bright=True)
-    b.text("/")
-    b.bg(1).fg(7, bright=True)
-    b.text(" COMMANDS ")
-    b.reset()
-    b.sgr(2)
-    b.text(" │ /help │ /think │ /do │ Ctrl-J │ Ctrl-D")
-
-    # Ready
-    b.move(20, 18)
-    b.fg(3, bright=True)
-    b.text("▓")
-    b.fg(1, bright=True)
-    b.text("░")
-    b.fg(2, bright=True)
-    b.text("▒")
-    b.fg(6, bright=True)
-    b.text("▓")
-    b.bg(1).fg(7, bright=True)
-    b.text(" READY TO HACK ")
-
-    b.reset()
-
-    return b.to_bytes(
-        add_sauce=True,
-        title="Amplifier Underground",
-        author="Amplifier Team",
-        group="Microsoft",
-    )
+    parts = [
+        _CLEAR_HOME,
+        "\x1b[6;25H" + _UNDERGROUND_TITLE,
+        # Underground node banner (dim red / white on red)
+        "\x1b[9;20H\x1b[2m\x1b[31mUNDERGROUND NODE\x1b[91m  ✗\x1b[41m\x1b[97m NO RULES \x1b[0m\x1b[91m✗",
+        f"\x1b[2m\x1b[31m  v{version}",
+        # System checklist (dim white with bright green checks)
+        "\x1b[12;18H\x1b[2m\x1b[37m├── \x1b[92m✓\x1b[37m SYSTEM ARMED",
+        "\x1b[13;18H\x1b[2m\x1b[37m├── \x1b[92m✓\x1b[37m AI CORE LOADED",
+        "\x1b[14;18H\x1b[2m\x1b[37m├── \x1b[92m✓\x1b[37m SECURITY BYPASSED",
+        "\x1b[15;18H\x1b[2m\x1b[37m└── \x1b[92m✓\x1b[37m ALL SYSTEMS GO",
+        # Commands with slashes
+        "\x1b[18;18H\x1b[91m/\x1b[93m/\x1b[92m/\x1b[41m\x1b[97m COMMANDS \x1b[0m\x1b[2m"
+        " │ /help │ /think │ /do │ Ctrl-J │ Ctrl-D",
+        # Ready
+        "\x1b[20;18H\x1b[93m▓\x1b[91m░\x1b[92m▒\x1b[96m▓\x1b[41m\x1b[97m READY TO HACK ",
+        _RESET,
+    ]
+    return _finish(parts, "Amplifier Underground")
 
 
 def generate_matrix(version: str) -> bytes:
     """Matrix: Green-on-black code rain aesthetic."""
-    b = AnsiBuilder(80, 25)
-    b.clear().home()
-
-    # All on black background
-    b.bg(0)
-
-    # Title
-    b.move(6, 15)
-    b.fg(2, bright=True).bold()  # Bright bold green
-    b.text("╔════════════════════════════════════════════╗")
-
-    b.move(7, 15)
-    b.text("║                                            ║")
-
-    b.move(8, 15)
-    b.text("║         A M P L I F I E R                 ║")
-
-    b.move(9, 15)
-    b.text("║                                            ║")
-
-    b.move(10, 15)
-    b.text("╚════════════════════════════════════════════╝")
-
-    # Block separator
-    b.move(12, 2)
-    b.fg(2).sgr(2)  # Dim green
-    b.text("▓" * 76)
-
-    # Init sequence
-    b.move(14, 10)
-    b.fg(2).sgr(2)
-    b.text("> SYSTEM INITIALIZATION...")
-
-    b.move(15, 10)
-    b.text("> LOADING NEURAL PATHWAYS...")
-
-    b.move(16, 10)
-    b.text("> ESTABLISHING QUANTUM LINK...")
-
-    b.move(17, 10)
-    b.fg(2, bright=True).bold()
-    b.text("> READY")
-
-    # Version
-    b.move(19, 10)
-    b.bg(2).fg(0, bright=True).bold()  # Black on bright green
-    b.text(f" MATRIX PROTOCOL v{version} ")
-
-    # Commands
-    b.move(21, 10)
-    b.reset().bg(0).fg(2).sgr(2)
-    b.text("CMD: /help │ /think │ /do │ Ctrl-J │ Ctrl-D")
-
-    # Connected
-    b.move(22, 32)
-    b.bg(2).fg(7, bright=True).bold()
-    b.text(" ● CONNECTED ● ")
-
-    b.reset()
-
-    return b.to_bytes(
-        add_sauce=True,
-        title="Amplifier Matrix",
-        author="Amplifier Team",
-        group="Microsoft",
-    )
+    parts = [
+        _CLEAR_HOME,
+        # All on black background
+        "\x1b[40m",
+        # Title (bright bold green)
+        "\x1b[6;15H\x1b[92m\x1b[1m╔════════════════════════════════════════════╗",
+        "\x1b[7;15H║                                            ║",
+        "\x1b[8;15H║         A M P L I F I E R                 ║",
+        "\x1b[9;15H║                                            ║",
+        "\x1b[10;15H╚════════════════════════════════════════════╝",
+        # Block separator (dim green)
+        "\x1b[12;2H\x1b[32m\x1b[2m" + _BLOCKS76,
+        # Init sequence (dim green)
+        "\x1b[14;10H\x1b[32m\x1b[2m> SYSTEM INITIALIZATION...",
+        "\x1b[15;10H> LOADING NEURAL PATHWAYS...",
+        "\x1b[16;10H> ESTABLISHING QUANTUM LINK...",
+        "\x1b[17;10H\x1b[92m\x1b[1m> READY",
+        # Version (black on bright green)
+        f"\x1b[19;10H\x1b[42m\x1b[90m\x1b[1m MATRIX PROTOCOL v{version} ",
+        # Commands (dim green on black)
+        "\x1b[21;10H\x1b[0m\x1b[40m\x1b[32m\x1b[2mCMD: /help │ /think │ /do │ Ctrl-J │ Ctrl-D",
+        # Connected
+        "\x1b[22;32H\x1b[42m\x1b[97m\x1b[1m ● CONNECTED ● ",
+        _RESET,
+    ]
+    return _finish(parts, "Amplifier Matrix")
 
 
 def generate_retro(version: str) -> bytes:
     """Retro: Full 90s BBS with gradient borders."""
-    b = AnsiBuilder(80, 25)
-    b.clear().home()
-
-    # All on blue background
-    b.bg(4)
-
-    # Top gradient borders
-    b.move(2, 1)
-    b.fg(7, bright=True)
-    b.text("░" * 78)
-
-    b.move(3, 1)
-    b.fg(3, bright=True)
-    b.text("▒" * 78)
-
-    b.move(4, 1)
-    b.fg(6, bright=True)
-    b.text("▓" * 78)
-
-    # Title
-    b.move(7, 10)
-    b.fg(3, bright=True).bold()
-    b.text("╔══════════════════════════════════════════════════════╗")
-
-    b.move(8, 10)
-    b.text("║                                                      ║")
-
-    b.move(9, 10)
-    b.text("║              A M P L I F I E R                      ║")
-
-    b.move(10, 10)
-    b.text("║                                                      ║")
-
-    b.move(11, 10)
-    b.text("╚══════════════════════════════════════════════════════╝")
-
-    # BBS Header
-    b.move(13, 10)
-    b.fg(6, bright=True).bold()
-    b.text("░▒▓█  AI DEVELOPMENT BBS  █▓▒░  EST. 2024")
-
-    # Separator
-    b.move(15, 1)
-    b.fg(3, bright=True)
-    b.text("▓" * 78)
-
-    # Status board
-    b.move(17, 10)
-    b.fg(7, bright=True)
-    b.text(f"● NODE #42       ● SYSOP Claude v4.0       ● v{version}")
-
-    b.move(18, 10)
-    b.text("● LOCATION      ● UPTIME Just now")
-
-    # Commands
-    b.move(20, 10)
-    b.sgr(2)
-    b.text("COMMANDS: /help │ /think │ /do │ Ctrl-J │ Ctrl-D")
-
-    # Ready
-    b.move(21, 28)
-    b.bg(2).fg(7, bright=True).bold()  # White on green
-    b.text(" READY FOR INPUT ")
-
-    # Bottom gradient borders
-    b.reset().bg(4)
-
-    b.move(23, 1)
-    b.fg(6, bright=True)
-    b.text("▓" * 78)
-
-    b.move(24, 1)
-    b.fg(3, bright=True)
-    b.text("▒" * 78)
-
-    b.move(25, 1)
-    b.fg(7, bright=True)
-    b.text("░" * 78)
-
-    b.reset()
-
-    return b.to_bytes(
-        add_sauce=True,
-        title="Amplifier Retro",
-        author="Amplifier Team",
-        group="Microsoft",
-    )
+    parts = [
+        _CLEAR_HOME,
+        # All on blue background
+        "\x1b[44m",
+        # Top gradient borders
+        "\x1b[2;1H\x1b[97m" + _LIGHT78,
+        "\x1b[3;1H\x1b[93m" + _MEDIUM78,
+        "\x1b[4;1H\x1b[96m" + _HEAVY78,
+        # Title (bright bold yellow)
+        "\x1b[7;10H\x1b[93m\x1b[1m╔══════════════════════════════════════════════════════╗",
+        "\x1b[8;10H║                                                      ║",
+        "\x1b[9;10H║              A M P L I F I E R                      ║",
+        "\x1b[10;10H║                                                      ║",
+        "\x1b[11;10H╚══════════════════════════════════════════════════════╝",
+        # BBS Header (bright bold cyan)
+        "\x1b[13;10H\x1b[96m\x1b[1m░▒▓█  AI DEVELOPMENT BBS  █▓▒░  EST. 2024",
+        # Separator
+        "\x1b[15;1H\x1b[93m" + _HEAVY78,
+        # Status board (bright white)
+        f"\x1b[17;10H\x1b[97m● NODE #42       ● SYSOP Claude v4.0       ● v{version}",
+        "\x1b[18;10H● LOCATION      ● UPTIME Just now",
+        # Commands (dim)
+        "\x1b[20;10H\x1b[2mCOMMANDS: /help │ /think │ /do │ Ctrl-J │ Ctrl-D",
+        # Ready (bright bold white on green)
+        "\x1b[21;28H\x1b[42m\x1b[97m\x1b[1m READY FOR INPUT ",
+        # Bottom gradient borders
+        "\x1b[0m\x1b[44m",
+        "\x1b[23;1H\x1b[96m" + _HEAVY78,
+        "\x1b[24;1H\x1b[93m" + _MEDIUM78,
+        "\x1b[25;1H\x1b[97m" + _LIGHT78,
+        _RESET,
+    ]
+    return _finish(parts, "Amplifier Retro")
 
 
 def main():
@@ -395,6 +196,11 @@ def main():
 
     version = "0.1.0"
 
+    # Generation is deterministic in (version, this script), so hash the
+    # script source itself - bytecode (co_code) is blind to literal and
+    # module-constant edits and would leave stale banners on disk
+    key = hashlib.blake2b(f"{version}|".encode() + Path(__file__).read_bytes()).hexdigest()[:16]
+
     banners = {
         "classic": generate_classic,
         "cyber": generate_cyber,
@@ -404,10 +210,18 @@ def main():
     }
 
     for name, generator in banners.items():
+        output_path = output_dir / f"{name}.ans"
+        key_path = output_dir / f"{name}.key"
+
+        # A matching key file means the existing .ans is already current
+        if output_path.exists() and key_path.exists() and key_path.read_text() == key:
+            print(f"Skipping {name} (up to date)")
+            continue
+
         print(f"Generating {name}...")
         data = generator(version)
-        output_path = output_dir / f"{name}.ans"
         output_path.write_bytes(data)
+        key_path.write_text(key)
         print(f"  → {output_path} ({len(data)} bytes)")
 
     print(f"\n✅ Generated {len(banners)} banners in {output_dir}/")
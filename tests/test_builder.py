@@ -46,6 +46,28 @@ def test_builder_move():
     assert "Positioned" in result
 
 
+def test_builder_box():
+    """Test box drawing: geometry and double-line borders."""
+    b = AnsiBuilder()
+    b.box(10, 20, 5, 3)  # 5x3 double-line box at (10, 20)
+
+    result = b.to_text()
+    assert "\x1b[10;20H╔═══╗" in result  # Top row at `row`
+    assert "\x1b[11;20H║   ║" in result  # Interior row
+    assert "\x1b[12;20H╚═══╝" in result  # Bottom row at row + h - 1
+
+
+def test_builder_box_single():
+    """Test single-line border variant."""
+    b = AnsiBuilder()
+    b.box(1, 1, 4, 2, border="single")  # No interior rows when h == 2
+
+    result = b.to_text()
+    assert "\x1b[1;1H┌──┐" in result
+    assert "\x1b[2;1H└──┘" in result
+    assert "│" not in result
+
+
 def test_builder_reset():
     """Test reset method."""
     b = AnsiBuilder()
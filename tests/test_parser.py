@@ -1,6 +1,6 @@
 """Tests for ANSI parser and iCE color mapping."""
 
-from ansiterm.parser import filter_safe, ice_fix, tokenize_ansi
+from ansiterm.parser import filter_safe, ice_fix, tokenize_ansi, transform
 
 
 def test_ice_fix():
@@ -54,6 +54,37 @@ def test_filter_safe():
     assert "Title" not in filtered
 
 
+def test_transform():
+    """Test fused iCE mapping + safety filtering in one pass."""
+    # iCE mapped and OSC dropped together
+    assert transform("\x1b[5;44mTEXT\x1b]0;Title\x07") == "\x1b[104mTEXT"
+
+
+def test_transform_matches_two_pass():
+    """transform() is equivalent to ice_fix() followed by filter_safe()."""
+    samples = [
+        "\x1b[2J\x1b[H\x1b[5;10H\x1b[5;44m\x1b[93mHELLO\x1b[0m",
+        "Plain text, no escapes",
+        "\x1b[31mRed\x1b]0;Title\x07\x1b[5;41mICE\x1b[0m",
+        "\x1b[?25l\x1b[10;20HArt\x1b[K\x1b[?25h",
+    ]
+    for text in samples:
+        assert transform(text) == filter_safe(ice_fix(text))
+
+
+def test_transform_unterminated_csi():
+    """Unterminated CSI at end of input: dropped in safe mode, kept otherwise."""
+    text = "Art\x1b[31"
+    assert transform(text, safe=True) == "Art"
+    assert transform(text, safe=False) == text
+
+
+def test_transform_clean_input_unchanged():
+    """Safe, iCE-free input takes the fast path and comes back unchanged."""
+    text = "\x1b[2J\x1b[H\x1b[31mRed\x1b[0m"
+    assert transform(text) is text
+
+
 def test_tokenize_ansi_safe_mode():
     """Test that safe_mode identifies dangerous sequences."""
     # OSC sequence